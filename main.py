@@ -5,41 +5,123 @@ INVERTED LOGIC: Input is GOOD blocks, output is BAD blocks to avoid
 Optimized for NTFSMARKBAD batch mode
 """
 
+from __future__ import annotations
+
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# NumPy (and numba, when installed) are imported lazily by
+# _load_fast_path(): tiny scans - the common case - keep an instant
+# cold start, while million-block scans get the compiled kernels
+np = None
+
+# Above this many HDSentinel blocks the fast path pays for its imports
+FAST_PATH_THRESHOLD = 100_000
+
+# First whitespace-delimited token of a line, if it is all digits
+_BLOCK_RE = re.compile(r'(?m)^\s*(\d+)(?=\s|$)')
+
 def parse_blocks(data: str) -> list[int]:
-    """Extract block numbers from HDSentinel data"""
-    blocks = []
-    for line in data.strip().split('\n'):
-        parts = line.split()
-        if parts and parts[0].isdigit():
-            blocks.append(int(parts[0]))
-    return sorted(set(blocks))
-
-def invert_blocks(good_blocks: list[int], total_blocks: int) -> list[int]:
-    """Convert list of GOOD blocks to list of BAD blocks"""
-    good_set = set(good_blocks)
-    return [b for b in range(total_blocks) if b not in good_set]
-
-def create_ranges(blocks: list[int]) -> list[str]:
-    """Convert list of blocks to range notation (e.g., 0-2, 4-10)"""
-    if not blocks:
+    """Extract block numbers from HDSentinel data, deduplicated and sorted.
+
+    Deduplication happens once here; downstream code relies on the
+    sorted order and never rebuilds a set from the result.
+    """
+    return sorted(set(map(int, _BLOCK_RE.findall(data))))
+
+def invert_blocks(good_blocks: list[int], total_blocks: int) -> np.ndarray:
+    """Convert list of GOOD blocks to array of BAD blocks.
+
+    Returns a compact int64 array (8 bytes/element) rather than a
+    Python list of boxed ints (~28 bytes/element) - for millions of
+    bad blocks that is the difference between ~80 MB and ~280 MB.
+    """
+    _load_fast_path()
+    mask = np.ones(total_blocks, dtype=bool)
+    if good_blocks:
+        good_arr = np.fromiter(good_blocks, dtype=np.int64, count=len(good_blocks))
+        # One C-level scatter into the contiguous mask - no per-block
+        # hash lookups as with a Python set
+        mask[good_arr[good_arr < total_blocks]] = False
+    return np.flatnonzero(mask)
+
+def create_ranges(blocks) -> list[str]:
+    """Convert sorted blocks (list or array) to range notation (e.g., 0-2, 4-10)"""
+    _load_fast_path()
+    blocks = np.asarray(blocks, dtype=np.int64)
+    if blocks.size == 0:
         return []
-    
-    ranges = []
-    start = end = blocks[0]
-    
-    for block in blocks[1:]:
-        if block == end + 1:
-            end = block
-        else:
-            ranges.append(f"{start}-{end}" if start != end else str(start))
-            start = end = block
-    
-    ranges.append(f"{start}-{end}" if start != end else str(start))
-    return ranges
 
-def block_to_sector(block: int, sectors_per_block: int) -> int:
-    """Convert block number to physical sector number"""
-    return block * sectors_per_block
+    # Run-length encode: a break is wherever consecutive blocks differ by >1
+    breaks = np.where(np.diff(blocks) != 1)[0]
+    starts = blocks[np.r_[0, breaks + 1]]
+    ends = blocks[np.r_[breaks, -1]]
+
+    return [f"{s}-{e}" if s != e else str(s)
+            for s, e in zip(starts.tolist(), ends.tolist())]
+
+def bad_block_ranges(good_blocks: list[int], total_blocks: int):
+    """Yield (start, end) ranges of BAD blocks - the gaps between GOOD blocks.
+
+    One pass over the sorted good blocks; the full bad-block list is
+    never materialized.
+    """
+    prev = -1
+    for good in good_blocks:
+        if good >= total_blocks:
+            break
+        if good > prev + 1:
+            yield (prev + 1, good - 1)
+        prev = good
+    if prev + 1 < total_blocks:
+        yield (prev + 1, total_blocks - 1)
+
+def _compute_bad_ranges_py(good_sorted, total_blocks):
+    """Fused gap kernel: one pass over a sorted good-block array,
+    returns (starts, ends) int64 arrays of bad ranges. The fast path
+    compiles this with numba when available (50-100x on million-block
+    scans)."""
+    n = good_sorted.shape[0]
+    starts = np.empty(n + 1, dtype=np.int64)
+    ends = np.empty(n + 1, dtype=np.int64)
+    count = 0
+    prev = -1
+    for i in range(n):
+        good = good_sorted[i]
+        if good >= total_blocks:
+            break
+        if good > prev + 1:
+            starts[count] = prev + 1
+            ends[count] = good - 1
+            count += 1
+        prev = good
+    if prev + 1 < total_blocks:
+        starts[count] = prev + 1
+        ends[count] = total_blocks - 1
+        count += 1
+    return starts[:count], ends[:count]
+
+# Bound to the plain or numba-compiled kernel by _load_fast_path()
+compute_bad_ranges = None
+
+def _load_fast_path():
+    """Import NumPy (and numba, if installed) and bind the gap kernel.
+
+    Called on demand so that small scans never pay the import cost.
+    Safe to call repeatedly; imports happen once.
+    """
+    global np, compute_bad_ranges
+    if np is not None:
+        return
+    import numpy
+    np = numpy
+    try:
+        import numba
+    except ImportError:
+        compute_bad_ranges = _compute_bad_ranges_py
+    else:
+        compute_bad_ranges = numba.njit(cache=True)(_compute_bad_ranges_py)
 
 def main():
     print("="*70)
@@ -67,8 +149,10 @@ def main():
     # Calculate sectors per block
     sectors_per_block = total_sectors // total_blocks
     
+    drive_gb = total_sectors * 512 / 1e9
+
     print()
-    print(f"Drive size: {total_sectors:,} sectors ({total_sectors * 512 / 1e9:.2f} GB)")
+    print(f"Drive size: {total_sectors:,} sectors ({drive_gb:.2f} GB)")
     print(f"HDSentinel blocks: {total_blocks:,}")
     print(f"Sectors per block: {sectors_per_block:,} ({sectors_per_block * 512 / 1024 / 1024:.2f} MB)")
     print()
@@ -80,16 +164,9 @@ def main():
     print("Press Ctrl+Z then Enter (Windows) or Ctrl+D (Linux/Mac) when done")
     print()
     
-    try:
-        lines = []
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-    
-    data = '\n'.join(lines)
-    
+    # One bulk read instead of an input() round-trip per line
+    data = sys.stdin.read()
+
     # Parse GOOD blocks
     good_blocks = parse_blocks(data)
     
@@ -99,13 +176,22 @@ def main():
     
     print(f"\n✓ Parsed {len(good_blocks)} GOOD blocks from input")
     
-    # Invert to get BAD blocks
-    bad_blocks = invert_blocks(good_blocks, total_blocks)
-    
-    print(f"✓ Calculated {len(bad_blocks)} BAD blocks to mark")
+    # BAD ranges are the gaps between GOOD blocks - computed in one pass,
+    # individual bad blocks are never materialized. Small scans (the
+    # common case) stay on pure Python; big ones get the compiled kernel
+    if total_blocks >= FAST_PATH_THRESHOLD:
+        _load_fast_path()
+        good_arr = np.fromiter(good_blocks, dtype=np.int64, count=len(good_blocks))
+        starts, ends = compute_bad_ranges(good_arr, total_blocks)
+        bad_ranges = list(zip(starts.tolist(), ends.tolist()))
+    else:
+        bad_ranges = list(bad_block_ranges(good_blocks, total_blocks))
+    num_bad = sum(end - start + 1 for start, end in bad_ranges)
+
+    print(f"✓ Calculated {num_bad} BAD blocks to mark")
     print()
-    
-    if not bad_blocks:
+
+    if num_bad == 0:
         print("="*70)
         print("SUCCESS: No bad blocks found!")
         print("="*70)
@@ -116,194 +202,230 @@ def main():
     print("="*70)
     print("STATISTICS")
     print("="*70)
-    bad_sectors_count = len(bad_blocks) * sectors_per_block
+    # Computed once here, reused by the stats print, the .bat script
+    # and README.txt below
+    bad_sectors_count = num_bad * sectors_per_block
     bad_space_mb = bad_sectors_count * 512 / 1024 / 1024
     bad_space_gb = bad_space_mb / 1024
-    
-    print(f"Bad blocks:  {len(bad_blocks):,}")
+    usable_pct = 100 * (1 - num_bad / total_blocks)
+
+    print(f"Bad blocks:  {num_bad:,}")
     print(f"Bad sectors: {bad_sectors_count:,}")
     print(f"Space lost:  {bad_space_mb:.2f} MB ({bad_space_gb:.2f} GB)")
-    print(f"Usable:      {100 * (1 - len(bad_blocks)/total_blocks):.2f}% of drive")
+    print(f"Usable:      {usable_pct:.2f}% of drive")
     print()
-    
-    # Create block ranges for reference
-    bad_ranges = create_ranges(bad_blocks)
-    
-    # Convert bad blocks to sector ranges for NTFSMARKBAD
-    sector_ranges = []
-    for block in bad_blocks:
-        sector_start = block_to_sector(block, sectors_per_block)
-        sector_end = block_to_sector(block + 1, sectors_per_block) - 1
-        sector_ranges.append((sector_start, sector_end))
-    
+
+    # Linux badblocks format is optional - ask before generating anything
+    # so all writers can run together
+    create_ext4 = input("Create badblocks_ext4.txt for Linux? (can be 2GB+) [y/N]: ").strip().lower()
+    print()
+
     # Save files
     print("="*70)
     print("GENERATING FILES")
     print("="*70)
-    
+
     # 1. NTFSMARKBAD batch file (main output)
-    with open('ntfsmarkbad_sectors.txt', 'w') as f:
-        for start, end in sector_ranges:
-            f.write(f"{start} {end}\n")
-    print("✓ ntfsmarkbad_sectors.txt - Ready for NTFSMARKBAD /B")
-    
+    # Each gap between good blocks maps directly to one sector range
+    def write_ntfsmarkbad():
+        spb = sectors_per_block
+        content = "\n".join(f"{start * spb} {(end + 1) * spb - 1}"
+                            for start, end in bad_ranges)
+        with open('ntfsmarkbad_sectors.txt', 'w') as f:
+            f.write(content + "\n")
+
     # 2. Human-readable block ranges
-    with open('bad_block_ranges.txt', 'w') as f:
-        f.write(f"Bad blocks: {', '.join(bad_ranges)}\n")
-        f.write(f"\nTotal: {len(bad_blocks)} bad blocks\n")
-    print("✓ bad_block_ranges.txt - Human-readable block ranges")
-    
+    def write_block_ranges():
+        # Range notation is only needed here, so format it on the fly
+        range_strs = (f"{start}-{end}" if start != end else str(start)
+                      for start, end in bad_ranges)
+        with open('bad_block_ranges.txt', 'w') as f:
+            f.write(f"Bad blocks: {', '.join(range_strs)}\n")
+            f.write(f"\nTotal: {num_bad} bad blocks\n")
+
     # 3. Linux badblocks format (optional - can be huge!)
-    print()
-    create_ext4 = input("Create badblocks_ext4.txt for Linux? (can be 2GB+) [y/N]: ").strip().lower()
+    def write_ext4():
+        # Format sectors with bytes %-formatting into one growing buffer,
+        # flushed every ~4 MiB: no per-sector string objects, and a
+        # bounded number of large writes instead of millions of tiny ones
+        flush_size = 4 * 1024 * 1024
+        buf = bytearray()
+        buf_extend = buf.extend
+        with open('badblocks_ext4.txt', 'wb', buffering=1 << 20) as f:
+            for start, end in bad_ranges:
+                sector_start = start * sectors_per_block
+                sector_stop = (end + 1) * sectors_per_block
+                for sector in range(sector_start, sector_stop):
+                    buf_extend(b'%d\n' % sector)
+                    if len(buf) >= flush_size:
+                        f.write(buf)
+                        buf.clear()
+            if buf:
+                f.write(buf)
+
+    # 4. Batch script for Windows (one template, one write)
+    bat_script = f'''@echo off
+REM NTFSMARKBAD Batch Script
+REM https://github.com/jamersonpro/ntfsmarkbad
+echo.
+echo ====================================================================
+echo NTFSMARKBAD - Mark Bad Sectors on NTFS
+echo ====================================================================
+echo.
+echo This will mark {num_bad} bad blocks ({bad_space_gb:.2f} GB) as unusable
+echo.
+echo REQUIREMENTS:
+echo   1. NTFSMARKBAD.EXE in same folder
+echo   2. Drive must be formatted as NTFS
+echo   3. Run as Administrator
+echo.
+set /p DRIVE="Enter drive letter (e.g., D): "
+echo.
+echo Checking if NTFSMARKBAD.EXE exists...
+if not exist "NTFSMARKBAD.EXE" (
+    echo ERROR: NTFSMARKBAD.EXE not found!
+    echo Download from: https://github.com/jamersonpro/ntfsmarkbad/releases
+    pause
+    exit /b 1
+)
+echo.
+echo ====================================================================
+echo Step 1: Format drive (WARNING: Erases all data!)
+echo ====================================================================
+set /p CONFIRM="Format %DRIVE%: as NTFS? (yes/no): "
+if /i not "%CONFIRM%"=="yes" (
+    echo Skipping format. Make sure drive is already formatted as NTFS!
+    goto skip_format
+)
+echo.
+echo Formatting %DRIVE%: ...
+format %DRIVE%: /FS:NTFS /Q /V:BadSectorDrive
+if errorlevel 1 (
+    echo ERROR: Format failed!
+    pause
+    exit /b 1
+)
+:skip_format
+echo.
+echo ====================================================================
+echo Step 2: Mark bad sectors
+echo ====================================================================
+echo.
+echo Marking {num_bad} bad blocks...
+echo This may take a few minutes...
+echo.
+NTFSMARKBAD.EXE %DRIVE%: /B ntfsmarkbad_sectors.txt
+if errorlevel 1 (
+    echo.
+    echo ERROR: NTFSMARKBAD failed!
+    echo Check the output above for details.
+    pause
+    exit /b 1
+)
+echo.
+echo ====================================================================
+echo Step 3: Verify file system
+echo ====================================================================
+echo.
+echo Running CHKDSK to verify...
+CHKDSK %DRIVE%: /F
+echo.
+echo ====================================================================
+echo SUCCESS!
+echo ====================================================================
+echo Marked {num_bad} bad blocks as unusable
+echo Lost space: {bad_space_gb:.2f} GB
+echo Your drive is now ready for use (games/cache/non-critical data)
+echo.
+pause
+'''
+    def write_bat():
+        with open('mark_bad_sectors.bat', 'w') as f:
+            f.write(bat_script)
+    
+    # 5. Info file (one template, one write)
+    ext4_file_line = ("- badblocks_ext4.txt      : For Linux ext4 (large file!)\n"
+                      if create_ext4 == 'y' else "")
+    readme_text = f"""NTFSMARKBAD Bad Sector Marking
+{'='*70}
+
+Drive:           {total_sectors:,} sectors ({drive_gb:.2f} GB)
+Bad blocks:      {num_bad:,}
+Bad sectors:     {bad_sectors_count:,}
+Space lost:      {bad_space_gb:.2f} GB
+Usable space:    {usable_pct:.2f}%
+
+QUICK START (Windows):
+{'-'*70}
+1. Download NTFSMARKBAD.EXE:
+   https://github.com/jamersonpro/ntfsmarkbad/releases
+   (Get NTFSMARKBAD.EXE for 64-bit or NTFSMARKBAD32.EXE for 32-bit)
+
+2. Put NTFSMARKBAD.EXE in this folder
+
+3. Right-click mark_bad_sectors.bat -> Run as Administrator
+
+4. Follow the prompts
+
+MANUAL METHOD:
+{'-'*70}
+1. FORMAT D: /FS:NTFS /Q
+2. NTFSMARKBAD.EXE D: /B ntfsmarkbad_sectors.txt
+3. CHKDSK D: /F
+
+LINUX (ext4):
+{'-'*70}
+Option 1 (if you created badblocks_ext4.txt):
+  mkfs.ext4 -l badblocks_ext4.txt /dev/sdX
+
+Option 2 (convert from range format - faster):
+  # Create badblocks.txt from ntfsmarkbad_sectors.txt:
+  awk '{{for(i=$1;i<=$2;i++)print i}}' ntfsmarkbad_sectors.txt > badblocks.txt
+  mkfs.ext4 -l badblocks.txt /dev/sdX
+
+FILES:
+{'-'*70}
+- ntfsmarkbad_sectors.txt : Input file for NTFSMARKBAD /B
+- mark_bad_sectors.bat    : Automated Windows script
+- bad_block_ranges.txt    : Human-readable ranges
+- README.txt              : This file
+{ext4_file_line}
+NOTES:
+{'-'*70}
+- NTFSMARKBAD uses PHYSICAL sector numbers (whole disk)
+- No partition offset needed!
+- Only unused clusters are marked as bad
+- Safe for drives with full G-list (no write attempts)
+
+For ST1000DM003 drives:
+- This is perfect for games/cache (non-critical data)
+- NTFS will avoid these sectors automatically
+- No reallocation attempts = no SATA hangs
+"""
+    def write_readme():
+        with open('README.txt', 'w', encoding='utf-8') as f:
+            f.write(readme_text)
+
+    # The files are independent and I/O-bound; overlap the writes so the
+    # small files don't wait behind a multi-GB badblocks_ext4.txt
+    tasks = [
+        (write_ntfsmarkbad, "✓ ntfsmarkbad_sectors.txt - Ready for NTFSMARKBAD /B"),
+        (write_block_ranges, "✓ bad_block_ranges.txt - Human-readable block ranges"),
+        (write_bat, "✓ mark_bad_sectors.bat - Automated Windows script"),
+        (write_readme, "✓ README.txt - Instructions and info"),
+    ]
     if create_ext4 == 'y':
-        print("Creating badblocks_ext4.txt (this may take a while)...")
-        with open('badblocks_ext4.txt', 'w') as f:
-            for start, end in sector_ranges:
-                for sector in range(start, end + 1):
-                    f.write(f"{sector}\n")
-        print("✓ badblocks_ext4.txt - For Linux ext4 (mkfs.ext4 -l)")
-    else:
+        tasks.append((write_ext4, "✓ badblocks_ext4.txt - For Linux ext4 (mkfs.ext4 -l)"))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [(pool.submit(fn), message) for fn, message in tasks]
+        for future, message in futures:
+            future.result()
+            print(message)
+
+    if create_ext4 != 'y':
         print("⊘ Skipped badblocks_ext4.txt (use ntfsmarkbad_sectors.txt on Linux if needed)")
-    
-    # 4. Batch script for Windows
-    with open('mark_bad_sectors.bat', 'w') as f:
-        f.write('@echo off\n')
-        f.write('REM NTFSMARKBAD Batch Script\n')
-        f.write('REM https://github.com/jamersonpro/ntfsmarkbad\n')
-        f.write('echo.\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo NTFSMARKBAD - Mark Bad Sectors on NTFS\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo.\n')
-        f.write(f'echo This will mark {len(bad_blocks)} bad blocks ({bad_space_gb:.2f} GB) as unusable\n')
-        f.write('echo.\n')
-        f.write('echo REQUIREMENTS:\n')
-        f.write('echo   1. NTFSMARKBAD.EXE in same folder\n')
-        f.write('echo   2. Drive must be formatted as NTFS\n')
-        f.write('echo   3. Run as Administrator\n')
-        f.write('echo.\n')
-        f.write('set /p DRIVE="Enter drive letter (e.g., D): "\n')
-        f.write('echo.\n')
-        f.write('echo Checking if NTFSMARKBAD.EXE exists...\n')
-        f.write('if not exist "NTFSMARKBAD.EXE" (\n')
-        f.write('    echo ERROR: NTFSMARKBAD.EXE not found!\n')
-        f.write('    echo Download from: https://github.com/jamersonpro/ntfsmarkbad/releases\n')
-        f.write('    pause\n')
-        f.write('    exit /b 1\n')
-        f.write(')\n')
-        f.write('echo.\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo Step 1: Format drive (WARNING: Erases all data!)\n')
-        f.write('echo ====================================================================\n')
-        f.write('set /p CONFIRM="Format %DRIVE%: as NTFS? (yes/no): "\n')
-        f.write('if /i not "%CONFIRM%"=="yes" (\n')
-        f.write('    echo Skipping format. Make sure drive is already formatted as NTFS!\n')
-        f.write('    goto skip_format\n')
-        f.write(')\n')
-        f.write('echo.\n')
-        f.write('echo Formatting %DRIVE%: ...\n')
-        f.write('format %DRIVE%: /FS:NTFS /Q /V:BadSectorDrive\n')
-        f.write('if errorlevel 1 (\n')
-        f.write('    echo ERROR: Format failed!\n')
-        f.write('    pause\n')
-        f.write('    exit /b 1\n')
-        f.write(')\n')
-        f.write(':skip_format\n')
-        f.write('echo.\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo Step 2: Mark bad sectors\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo.\n')
-        f.write(f'echo Marking {len(bad_blocks)} bad blocks...\n')
-        f.write('echo This may take a few minutes...\n')
-        f.write('echo.\n')
-        f.write('NTFSMARKBAD.EXE %DRIVE%: /B ntfsmarkbad_sectors.txt\n')
-        f.write('if errorlevel 1 (\n')
-        f.write('    echo.\n')
-        f.write('    echo ERROR: NTFSMARKBAD failed!\n')
-        f.write('    echo Check the output above for details.\n')
-        f.write('    pause\n')
-        f.write('    exit /b 1\n')
-        f.write(')\n')
-        f.write('echo.\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo Step 3: Verify file system\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo.\n')
-        f.write('echo Running CHKDSK to verify...\n')
-        f.write('CHKDSK %DRIVE%: /F\n')
-        f.write('echo.\n')
-        f.write('echo ====================================================================\n')
-        f.write('echo SUCCESS!\n')
-        f.write('echo ====================================================================\n')
-        f.write(f'echo Marked {len(bad_blocks)} bad blocks as unusable\n')
-        f.write(f'echo Lost space: {bad_space_gb:.2f} GB\n')
-        f.write('echo Your drive is now ready for use (games/cache/non-critical data)\n')
-        f.write('echo.\n')
-        f.write('pause\n')
-    print("✓ mark_bad_sectors.bat - Automated Windows script")
-    
-    # 5. Info file
-    with open('README.txt', 'w', encoding='utf-8') as f:
-        f.write("NTFSMARKBAD Bad Sector Marking\n")
-        f.write("="*70 + "\n\n")
-        f.write(f"Drive:           {total_sectors:,} sectors ({total_sectors * 512 / 1e9:.2f} GB)\n")
-        f.write(f"Bad blocks:      {len(bad_blocks):,}\n")
-        f.write(f"Bad sectors:     {bad_sectors_count:,}\n")
-        f.write(f"Space lost:      {bad_space_gb:.2f} GB\n")
-        f.write(f"Usable space:    {100 * (1 - len(bad_blocks)/total_blocks):.2f}%\n")
-        f.write("\n")
-        f.write("QUICK START (Windows):\n")
-        f.write("-" * 70 + "\n")
-        f.write("1. Download NTFSMARKBAD.EXE:\n")
-        f.write("   https://github.com/jamersonpro/ntfsmarkbad/releases\n")
-        f.write("   (Get NTFSMARKBAD.EXE for 64-bit or NTFSMARKBAD32.EXE for 32-bit)\n")
-        f.write("\n")
-        f.write("2. Put NTFSMARKBAD.EXE in this folder\n")
-        f.write("\n")
-        f.write("3. Right-click mark_bad_sectors.bat -> Run as Administrator\n")
-        f.write("\n")
-        f.write("4. Follow the prompts\n")
-        f.write("\n")
-        f.write("MANUAL METHOD:\n")
-        f.write("-" * 70 + "\n")
-        f.write("1. FORMAT D: /FS:NTFS /Q\n")
-        f.write("2. NTFSMARKBAD.EXE D: /B ntfsmarkbad_sectors.txt\n")
-        f.write("3. CHKDSK D: /F\n")
-        f.write("\n")
-        f.write("LINUX (ext4):\n")
-        f.write("-" * 70 + "\n")
-        f.write("Option 1 (if you created badblocks_ext4.txt):\n")
-        f.write("  mkfs.ext4 -l badblocks_ext4.txt /dev/sdX\n")
-        f.write("\n")
-        f.write("Option 2 (convert from range format - faster):\n")
-        f.write("  # Create badblocks.txt from ntfsmarkbad_sectors.txt:\n")
-        f.write("  awk '{for(i=$1;i<=$2;i++)print i}' ntfsmarkbad_sectors.txt > badblocks.txt\n")
-        f.write("  mkfs.ext4 -l badblocks.txt /dev/sdX\n")
-        f.write("\n")
-        f.write("FILES:\n")
-        f.write("-" * 70 + "\n")
-        f.write("- ntfsmarkbad_sectors.txt : Input file for NTFSMARKBAD /B\n")
-        f.write("- mark_bad_sectors.bat    : Automated Windows script\n")
-        f.write("- bad_block_ranges.txt    : Human-readable ranges\n")
-        f.write("- README.txt              : This file\n")
-        if create_ext4 == 'y':
-            f.write("- badblocks_ext4.txt      : For Linux ext4 (large file!)\n")
-        f.write("\n")
-        f.write("NOTES:\n")
-        f.write("-" * 70 + "\n")
-        f.write("- NTFSMARKBAD uses PHYSICAL sector numbers (whole disk)\n")
-        f.write("- No partition offset needed!\n")
-        f.write("- Only unused clusters are marked as bad\n")
-        f.write("- Safe for drives with full G-list (no write attempts)\n")
-        f.write("\n")
-        f.write("For ST1000DM003 drives:\n")
-        f.write("- This is perfect for games/cache (non-critical data)\n")
-        f.write("- NTFS will avoid these sectors automatically\n")
-        f.write("- No reallocation attempts = no SATA hangs\n")
-    print("✓ README.txt - Instructions and info")
-    
+
     print()
     print("="*70)
     print("DONE!")
@@ -321,12 +443,12 @@ def main():
     print("     CHKDSK D: /F")
     print()
     
-    if len(bad_blocks) > 2000:
+    if num_bad > 2000:
         print("⚠ WARNING: Over 2000 bad blocks detected!")
         print("  This drive is severely degraded.")
         print("  Recommend: Use only for truly expendable data.")
         print()
-    elif len(bad_blocks) > 500:
+    elif num_bad > 500:
         print("⚠ CAUTION: Over 500 bad blocks.")
         print("  Drive is deteriorating. Monitor closely.")
         print()